@@ -1,9 +1,13 @@
 import subprocess
 import os
-import random
+import shutil
 import time
+import matplotlib
+matplotlib.use('Agg')  # Render straight to files, no GUI backend probing
 import matplotlib.pyplot as plt
+import numpy as np
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Paths relative to project root
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -19,13 +23,68 @@ ALGORITHMS = {
     12: "Z-Algorithm"
 }
 PATTERN_LEN = 10
+# Bases scanned per measurement; small texts are searched repeatedly to reach it
+WORK_PER_MEASUREMENT = 10_000_000
 EXECUTABLE = os.path.join(PROJECT_ROOT, "bin/dna_pattern_matching")
 TEMP_DIR = os.path.join(PROJECT_ROOT, "bench_temp")
+NUCLEOTIDES = np.frombuffer(b"ACGT", dtype=np.uint8)
 
-def generate_dna(length):
-    return "".join(random.choice("ACGT") for _ in range(length))
+# Fixed seed so every run benchmarks the same sequences and patterns
+SEED = 0xC0FFEE
+RNG = np.random.default_rng(SEED)
+
+# Long-lived benchmark server and the pid that spawned it
+_server = None
+_server_pid = None
+
+def generate_dna_bytes(length):
+    idx = RNG.integers(0, 4, size=length, dtype=np.uint8)
+    return NUCLEOTIDES[idx].tobytes()
+
+def write_fasta(filename, name, seq_bytes):
+    with open(filename, "wb") as f:
+        f.write(f">{name}\n".encode())
+        f.write(seq_bytes)
+        f.write(b"\n")
+
+def get_server():
+    global _server, _server_pid
+    # Forked pool workers must not share the parent's server pipes
+    if _server is None or _server_pid != os.getpid() or _server.poll() is not None:
+        _server = subprocess.Popen([EXECUTABLE, "--benchmark-server"],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        _server_pid = os.getpid()
+    return _server
+
+def inner_iterations(size):
+    return max(1, int(WORK_PER_MEASUREMENT / size))
+
+def run_algorithm(algo_id, filename, pattern, iterations=1):
+    # One tab-separated request line in, one "<mean_time_ms>" line out (negative on error)
+    algo_name = ALGORITHMS[algo_id]
+    try:
+        server = get_server()
+        server.stdin.write(f"{algo_id}\t{filename}\t{pattern}\t{iterations}\n".encode())
+        server.stdin.flush()
+        output = server.stdout.readline()
+        
+        try:
+            time_taken = float(output)
+        except ValueError:
+            print(f"Invalid output from {algo_name}: {output!r}")
+            return 0
+        if time_taken < 0:
+            print(f"Error running {algo_name}")
+            return 0
+        return time_taken
+    except Exception as e:
+        print(f"Exception running {algo_name}: {e}")
+        return 0
 
 def run_benchmark():
+    global RNG
+    RNG = np.random.default_rng(SEED)
+
     if not os.path.exists(TEMP_DIR):
         os.makedirs(TEMP_DIR)
 
@@ -35,42 +94,38 @@ def run_benchmark():
 
     results = {name: [] for name in ALGORITHMS.values()}
     
-    print(f"{'Size':<10} | {'Algorithm':<15} | {'Time (ms)':<10}")
-    print("-" * 40)
-
+    tasks = []
     for size in SIZES:
         # Generate data
-        seq = generate_dna(size)
+        seq = generate_dna_bytes(size)
+        # Unique per size: all sizes are benchmarked concurrently below
         filename = os.path.join(TEMP_DIR, f"seq_{size}.fasta")
-        with open(filename, "w") as f:
-            f.write(f">seq_{size}\n{seq}\n")
+        write_fasta(filename, f"seq_{size}", seq)
         
-        # Pick a pattern that exists
-        start = random.randint(0, size - PATTERN_LEN)
-        pattern = seq[start:start+PATTERN_LEN]
+        # Pick a pattern that exists, decoding only that window of the bytes
+        start = int(RNG.integers(0, size - PATTERN_LEN + 1))
+        pattern = str(memoryview(seq)[start:start+PATTERN_LEN], 'ascii')
+
+        for algo_id in ALGORITHMS:
+            tasks.append((size, algo_id, filename, pattern, inner_iterations(size)))
+
+    # Each (size, algorithm) run is an independent subprocess
+    timings = {}
+    max_workers = min(os.cpu_count() or 1, len(ALGORITHMS))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_algorithm, *task[1:]): task for task in tasks}
+        for future in as_completed(futures):
+            size, algo_id = futures[future][:2]
+            timings[(size, algo_id)] = future.result()
 
+    print(f"{'Size':<10} | {'Algorithm':<15} | {'Time (ms)':<10}")
+    print("-" * 40)
+
+    for size in SIZES:
         for algo_id, algo_name in ALGORITHMS.items():
-            try:
-                # Run C program
-                cmd = [EXECUTABLE, "--benchmark", str(algo_id), filename, pattern]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    print(f"Error running {algo_name}: {result.stderr}")
-                    time_taken = 0
-                else:
-                    try:
-                        time_taken = float(result.stdout.strip())
-                    except ValueError:
-                        print(f"Invalid output from {algo_name}: {result.stdout}")
-                        time_taken = 0
-                
-                results[algo_name].append(time_taken)
-                print(f"{size:<10} | {algo_name:<15} | {time_taken:<10.4f}")
-                
-            except Exception as e:
-                print(f"Exception running {algo_name}: {e}")
-                results[algo_name].append(0)
+            time_taken = timings[(size, algo_id)]
+            results[algo_name].append(time_taken)
+            print(f"{size:<10} | {algo_name:<15} | {time_taken:<10.4f}")
 
     # Plotting
     plt.figure(figsize=(10, 6))
@@ -88,9 +143,7 @@ def run_benchmark():
     print(f"\nBenchmark complete. Graph saved to {output_file}")
 
     # Clean up
-    for f in os.listdir(TEMP_DIR):
-        os.remove(os.path.join(TEMP_DIR, f))
-    os.rmdir(TEMP_DIR)
+    shutil.rmtree(TEMP_DIR, ignore_errors=True)
 
 if __name__ == "__main__":
     run_benchmark()
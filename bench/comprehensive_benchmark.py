@@ -10,17 +10,27 @@ Generates graphs, charts, and tables for:
 
 import subprocess
 import os
-import random
+import shutil
+import select
 import time
 import json
+import csv
+import io
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+matplotlib.use('Agg')  # Render straight to files, no GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
-from matplotlib.gridspec import GridSpec
+from PIL import Image
 
 # Configuration
 SIZES = [1000, 5000, 10000, 50000, 100000, 500000, 1000000]
 PATTERN_LENGTHS = [5, 10, 20, 50, 100]
+# Bases scanned per measurement; small texts are searched repeatedly to reach it
+WORK_PER_MEASUREMENT = 10_000_000
+# Once a single Naive search is projected to take longer than this at the next
+# size, or times out, larger sizes are extrapolated
+NAIVE_ABORT_MS = 5000
 ALGORITHMS = {
     15: {"name": "Naive", "complexity": "O(nm)", "color": "#FF6B6B"},
     3: {"name": "KMP", "complexity": "O(n+m)", "color": "#4ECDC4"},
@@ -31,11 +41,36 @@ ALGORITHMS = {
     12: {"name": "Z-Algorithm", "complexity": "O(n+m)", "color": "#A29BFE"}
 }
 
+# Complexity verification panels: (algo_id, row, col, title) in a 2x3 grid
+PLOT_CONFIGS = [
+    (15, 0, 0, "Naive - O(nm)"),
+    (3, 0, 1, "KMP - O(n+m)"),
+    (4, 0, 2, "Boyer-Moore - O(n/m) best"),
+    (11, 1, 0, "Rabin-Karp - O(n+m)"),
+    (12, 1, 1, "Z-Algorithm - O(n+m)"),
+    (6, 1, 2, "Shift-Or - O(n)")
+]
+
 # Paths relative to project root
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 EXECUTABLE = os.path.join(PROJECT_ROOT, "bin/dna_pattern_matching")
 TEMP_DIR = os.path.join(PROJECT_ROOT, "bench_temp")
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, "bench/results")
+NUCLEOTIDES = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+# Fixed seed so every run benchmarks the same sequences and patterns
+SEED = 0xC0FFEE
+RNG = np.random.default_rng(SEED)
+
+# Long-lived benchmark server and the pid that spawned it (see run_algorithm)
+_server = None
+_server_pid = None
+
+# Figure shared by all plot_* functions (see get_figure)
+_figure = None
+
+# Generated sequences keyed by size: size -> (sequence bytes, fasta filename)
+_seq_cache = {}
 
 def setup_directories():
     """Create necessary directories"""
@@ -43,65 +78,184 @@ def setup_directories():
         if not os.path.exists(d):
             os.makedirs(d)
 
-def generate_dna(length):
-    """Generate random DNA sequence"""
-    return "".join(random.choice("ACGT") for _ in range(length))
+def generate_dna_bytes(length):
+    """Generate random DNA sequence as ASCII bytes (vectorized lookup into ACGT)"""
+    idx = RNG.integers(0, 4, size=length, dtype=np.uint8)
+    return NUCLEOTIDES[idx].tobytes()
+
+def write_fasta(filename, name, seq_bytes):
+    """Write a single-record FASTA file without building an intermediate string"""
+    with open(filename, "wb") as f:
+        f.write(f">{name}\n".encode())
+        f.write(seq_bytes)
+        f.write(b"\n")
+
+def get_sequence(size):
+    """Return (sequence bytes, filename) for a size, generating and writing it once"""
+    if size not in _seq_cache:
+        seq = generate_dna_bytes(size)
+        # One file per size: sizes are benchmarked concurrently, so a single
+        # reused path would be overwritten while other workers read it
+        filename = os.path.join(TEMP_DIR, f"seq_{size}.fasta")
+        write_fasta(filename, f"seq_{size}", seq)
+        _seq_cache[size] = (seq, filename)
+    return _seq_cache[size]
 
-def run_algorithm(algo_id, text_file, pattern):
-    """Run a single algorithm and return time in ms"""
+def get_server():
+    """Return this process's benchmark server, spawning it if needed"""
+    global _server, _server_pid
+    # Forked pool workers must not share the parent's server pipes
+    if _server is None or _server_pid != os.getpid() or _server.poll() is not None:
+        _server = subprocess.Popen([EXECUTABLE, "--benchmark-server"],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        _server_pid = os.getpid()
+    return _server
+
+def stop_server():
+    """Terminate this process's benchmark server"""
+    global _server
+    if _server is not None and _server_pid == os.getpid():
+        _server.kill()
+        _server.wait()
+        _server = None
+
+def inner_iterations(size):
+    """Number of searches to average over for a text of the given size"""
+    return max(1, int(WORK_PER_MEASUREMENT / size))
+
+def run_algorithm(algo_id, text_file, pattern, iterations=1, timeout=30):
+    """Run a single algorithm and return its mean time in ms over iterations
+
+    Requests go to a persistent `--benchmark-server` process instead of
+    spawning the executable per call. Handshake: write one tab-separated
+    "algo_id, text_file, pattern, iterations" line, read back one line
+    holding the mean time in ms (negative on error).
+    """
     try:
-        cmd = [EXECUTABLE, "--benchmark", str(algo_id), text_file, pattern]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        server = get_server()
+        server.stdin.write(f"{algo_id}\t{text_file}\t{pattern}\t{iterations}\n".encode())
+        server.stdin.flush()
         
-        if result.returncode != 0:
+        ready, _, _ = select.select([server.stdout], [], [], timeout)
+        if not ready:
+            stop_server()
             return None
         
         try:
-            time_taken = float(result.stdout.strip())
-            return time_taken
+            time_taken = float(server.stdout.readline())
         except ValueError:
+            stop_server()
             return None
-    except subprocess.TimeoutExpired:
-        return None
+        return time_taken if time_taken >= 0 else None
     except Exception as e:
         print(f"Error: {e}")
+        stop_server()
         return None
 
+def run_naive_series(tasks):
+    """Run the Naive tasks in size order until the next exceeds NAIVE_ABORT_MS
+
+    The per-search time is projected linearly to the next size (the pattern is
+    fixed, so O(nm) grows with n); a run that times out or fails also stops the
+    series. At least two sizes are measured first so a fit is always possible.
+    Returns {(size, algo_id): time}; sizes after the cutoff are left out.
+    """
+    timings = {}
+    measured = 0
+    tasks = sorted(tasks)
+    for i, (size, algo_id, filename, pattern, iterations) in enumerate(tasks):
+        time_taken = run_algorithm(algo_id, filename, pattern, iterations)
+        timings[(size, algo_id)] = time_taken
+        if time_taken is not None:
+            measured += 1
+        if measured < 2 or i + 1 == len(tasks):
+            continue
+        next_size = tasks[i + 1][0]
+        if time_taken is None or time_taken * next_size / size > NAIVE_ABORT_MS:
+            break
+    return timings
+
 def benchmark_varying_text_size(pattern_len=10):
-    """Benchmark: Varying text size with fixed pattern length"""
+    """Benchmark: Varying text size with fixed pattern length
+
+    Returns the per-algorithm results and a (len(ALGORITHMS), len(SIZES))
+    time matrix of measured times in ALGORITHMS/SIZES order, NaN where a run was
+    skipped or failed. Naive times for sizes past its NAIVE_ABORT_MS cutoff are
+    extrapolated from a log-log fit into the results only (listed under
+    "extrapolated"); they stay NaN in the matrix.
+    """
     print(f"\n{'='*60}")
     print(f"Benchmark 1: Varying Text Size (Pattern Length = {pattern_len})")
     print(f"{'='*60}")
     
-    results = {algo_id: {"times": [], "sizes": []} for algo_id in ALGORITHMS.keys()}
+    results = {algo_id: {"times": [], "sizes": [], "extrapolated": []} for algo_id in ALGORITHMS.keys()}
+    time_matrix = np.full((len(ALGORITHMS), len(SIZES)), np.nan)
     
+    # Build the (size, algo_id, filename, pattern, iterations) task list up front
+    tasks = []
+    naive_tasks = []
     for size in SIZES:
-        print(f"\nText size: {size:,} bp")
-        seq = generate_dna(size)
-        filename = os.path.join(TEMP_DIR, f"seq_{size}.fasta")
+        seq, filename = get_sequence(size)
         
-        with open(filename, "w") as f:
-            f.write(f">seq_{size}\n{seq}\n")
+        # Generate pattern that exists in text; decode only the window, via a
+        # zero-copy view of the sequence bytes
+        start = int(RNG.integers(0, max(0, size - pattern_len) + 1))
+        pattern = str(memoryview(seq)[start:start+pattern_len], 'ascii')
         
-        # Generate pattern that exists in text
-        start = random.randint(0, max(0, size - pattern_len))
-        pattern = seq[start:start+pattern_len]
-        
-        for algo_id, algo_info in ALGORITHMS.items():
+        for algo_id in ALGORITHMS.keys():
             # Skip Shift-Or for patterns > 64
             if algo_id == 6 and pattern_len > 64:
                 continue
-                
-            time_taken = run_algorithm(algo_id, filename, pattern)
+            task = (size, algo_id, filename, pattern, inner_iterations(size))
+            (naive_tasks if algo_id == 15 else tasks).append(task)
+    
+    # Runs are independent subprocesses, so dispatch them across cores
+    timings = {}
+    max_workers = min(os.cpu_count() or 1, len(ALGORITHMS))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Naive runs in one worker, in size order, so it can stop early
+        naive_future = executor.submit(run_naive_series, naive_tasks)
+        futures = {executor.submit(run_algorithm, *task[1:]): task for task in tasks}
+        for future in as_completed(futures):
+            size, algo_id = futures[future][:2]
+            timings[(size, algo_id)] = future.result()
+        timings.update(naive_future.result())
+    
+    # Fit Naive's measured points in log-log space to fill in skipped sizes
+    naive_fit = None
+    naive_points = sorted((size, t) for (size, algo_id), t in timings.items()
+                          if algo_id == 15 and t)
+    if len(naive_points) > 1:
+        fit_sizes, fit_times = zip(*naive_points)
+        naive_fit = np.polyfit(np.log(fit_sizes), np.log(fit_times), 1)
+    
+    # Collect in (size, algorithm) order so the series stay sorted by size
+    for size_idx, size in enumerate(SIZES):
+        print(f"\nText size: {size:,} bp")
+        for algo_idx, (algo_id, algo_info) in enumerate(ALGORITHMS.items()):
+            if algo_id == 15 and (size, algo_id) not in timings and naive_fit is not None:
+                time_taken = float(np.exp(naive_fit[1]) * size ** naive_fit[0])
+                results[algo_id]["times"].append(time_taken)
+                results[algo_id]["sizes"].append(size)
+                results[algo_id]["extrapolated"].append(size)
+                print(f"  {algo_info['name']:<20}: {time_taken:>10.4f} ms (extrapolated)")
+                continue
+            
+            if (size, algo_id) not in timings:
+                print(f"  {algo_info['name']:<20}: {'SKIPPED':>10}")
+                continue
+            
+            time_taken = timings[(size, algo_id)]
             
             if time_taken is not None:
+                time_matrix[algo_idx, size_idx] = time_taken
                 results[algo_id]["times"].append(time_taken)
                 results[algo_id]["sizes"].append(size)
                 print(f"  {algo_info['name']:<20}: {time_taken:>10.4f} ms")
             else:
                 print(f"  {algo_info['name']:<20}: {'FAILED':>10}")
     
-    return results
+    return results, time_matrix
 
 def benchmark_varying_pattern_length(text_size=100000):
     """Benchmark: Varying pattern length with fixed text size"""
@@ -111,25 +265,23 @@ def benchmark_varying_pattern_length(text_size=100000):
     
     results = {algo_id: {"times": [], "pattern_lens": []} for algo_id in ALGORITHMS.keys()}
     
-    # Generate text once
-    seq = generate_dna(text_size)
-    filename = os.path.join(TEMP_DIR, f"seq_{text_size}.fasta")
-    with open(filename, "w") as f:
-        f.write(f">seq_{text_size}\n{seq}\n")
+    # Reuse the text generated by the text size benchmark when available
+    seq, filename = get_sequence(text_size)
     
     for plen in PATTERN_LENGTHS:
         print(f"\nPattern length: {plen} bp")
         
         # Generate pattern that exists
-        start = random.randint(0, text_size - plen)
-        pattern = seq[start:start+plen]
+        start = int(RNG.integers(0, text_size - plen + 1))
+        pattern = str(memoryview(seq)[start:start+plen], 'ascii')
         
         for algo_id, algo_info in ALGORITHMS.items():
             # Skip Shift-Or for patterns > 64
             if algo_id == 6 and plen > 64:
                 continue
             
-            time_taken = run_algorithm(algo_id, filename, pattern)
+            time_taken = run_algorithm(algo_id, filename, pattern,
+                                       inner_iterations(text_size))
             
             if time_taken is not None:
                 results[algo_id]["times"].append(time_taken)
@@ -159,51 +311,68 @@ def benchmark_memory_usage():
     
     return memory_usage
 
+def get_figure(figsize):
+    """Return the shared figure, cleared and resized to figsize"""
+    global _figure
+    if _figure is None:
+        _figure = plt.figure(figsize=figsize)
+    else:
+        _figure.clf()
+        _figure.set_size_inches(figsize)
+    return _figure
+
 def plot_performance_comparison(results, output_file):
     """Create performance comparison graph"""
-    plt.figure(figsize=(12, 7))
+    fig = get_figure((12, 7))
+    ax = fig.add_subplot()
     
     for algo_id, data in results.items():
         if data["times"] and data["sizes"]:
             algo_info = ALGORITHMS[algo_id]
-            plt.plot(data["sizes"], data["times"], 
+            ax.plot(data["sizes"], data["times"], 
                     marker='o', label=f"{algo_info['name']} - {algo_info['complexity']}", 
                     color=algo_info['color'], linewidth=2, markersize=6)
-    
-    plt.xlabel("Text Size (base pairs)", fontsize=12, fontweight='bold')
-    plt.ylabel("Execution Time (ms)", fontsize=12, fontweight='bold')
-    plt.title("Performance Comparison: DNA Pattern Matching Algorithms\n(Varying Text Size, Pattern Length = 10 bp)", 
+            
+            # Hollow markers for extrapolated (not measured) points
+            if data["extrapolated"]:
+                ext_times = [t for s, t in zip(data["sizes"], data["times"]) if s in data["extrapolated"]]
+                ax.plot(data["extrapolated"], ext_times, 'o', markersize=8, 
+                        markerfacecolor='white', markeredgecolor=algo_info['color'], 
+                        markeredgewidth=2, label=f"{algo_info['name']} (extrapolated)")
+    
+    ax.set_xlabel("Text Size (base pairs)", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Execution Time (ms)", fontsize=12, fontweight='bold')
+    ax.set_title("Performance Comparison: DNA Pattern Matching Algorithms\n(Varying Text Size, Pattern Length = 10 bp)", 
               fontsize=14, fontweight='bold')
-    plt.legend(loc='best', fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.xscale('log')
-    plt.yscale('log')
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Saved: {output_file}")
-    plt.close()
 
 def plot_pattern_length_impact(results, output_file):
     """Create graph showing impact of pattern length"""
-    plt.figure(figsize=(12, 7))
+    fig = get_figure((12, 7))
+    ax = fig.add_subplot()
     
     for algo_id, data in results.items():
         if data["times"] and data["pattern_lens"]:
             algo_info = ALGORITHMS[algo_id]
-            plt.plot(data["pattern_lens"], data["times"], 
+            ax.plot(data["pattern_lens"], data["times"], 
                     marker='s', label=algo_info['name'], 
                     color=algo_info['color'], linewidth=2, markersize=6)
     
-    plt.xlabel("Pattern Length (base pairs)", fontsize=12, fontweight='bold')
-    plt.ylabel("Execution Time (ms)", fontsize=12, fontweight='bold')
-    plt.title("Impact of Pattern Length on Algorithm Performance\n(Text Size = 100,000 bp)", 
+    ax.set_xlabel("Pattern Length (base pairs)", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Execution Time (ms)", fontsize=12, fontweight='bold')
+    ax.set_title("Impact of Pattern Length on Algorithm Performance\n(Text Size = 100,000 bp)", 
               fontsize=14, fontweight='bold')
-    plt.legend(loc='best', fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Saved: {output_file}")
-    plt.close()
 
 def plot_memory_usage(memory_data, output_file):
     """Create bar chart for memory usage"""
@@ -211,120 +380,187 @@ def plot_memory_usage(memory_data, output_file):
     memory = [v['memory'] / 1024 for v in memory_data.values()]  # Convert to KB
     colors = [ALGORITHMS[k]['color'] if k in ALGORITHMS else '#95A5A6' for k in memory_data.keys()]
     
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(names, memory, color=colors, edgecolor='black', linewidth=1.5)
+    fig = get_figure((10, 6))
+    ax = fig.add_subplot()
+    bars = ax.bar(names, memory, color=colors, edgecolor='black', linewidth=1.5)
     
-    plt.xlabel("Algorithm", fontsize=12, fontweight='bold')
-    plt.ylabel("Memory Usage (KB)", fontsize=12, fontweight='bold')
-    plt.title("Theoretical Memory Usage Comparison\n(Text: 1M bp, Pattern: 10 bp)", 
+    ax.set_xlabel("Algorithm", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Memory Usage (KB)", fontsize=12, fontweight='bold')
+    ax.set_title("Theoretical Memory Usage Comparison\n(Text: 1M bp, Pattern: 10 bp)", 
               fontsize=14, fontweight='bold')
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(True, axis='y', alpha=0.3)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.grid(True, axis='y', alpha=0.3)
     
     # Add value labels on bars
     for bar in bars:
         height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
+        ax.text(bar.get_x() + bar.get_width()/2., height,
                 f'{height:.1f}' if height > 0 else '~0',
                 ha='center', va='bottom', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Saved: {output_file}")
-    plt.close()
 
-def plot_speedup_comparison(results, output_file):
-    """Create speedup comparison relative to Naive algorithm"""
-    plt.figure(figsize=(12, 7))
+def plot_speedup_comparison(results, time_matrix, output_file):
+    """Create speedup comparison relative to Naive algorithm
+
+    Speedups against an extrapolated Naive time are drawn with hollow markers.
+    """
+    algo_order = list(ALGORITHMS)
+    naive_idx = algo_order.index(15)
+    
+    # Baseline: measured Naive times, with extrapolated ones filled in
+    baseline = time_matrix[naive_idx].copy()
+    size_to_idx = {size: idx for idx, size in enumerate(SIZES)}
+    for size, time_ms in zip(results[15]["sizes"], results[15]["times"]):
+        if size in results[15]["extrapolated"]:
+            baseline[size_to_idx[size]] = time_ms
+    extrapolated = np.isin(SIZES, results[15]["extrapolated"])
     
     # Get Naive algorithm times as baseline
-    naive_times = results[15]["times"]
-    naive_sizes = results[15]["sizes"]
-    
-    if not naive_times:
+    if not np.isfinite(baseline).any():
         print("Cannot create speedup comparison - Naive algorithm data missing")
         return
     
-    for algo_id, data in results.items():
-        if algo_id == 15 or not data["times"]:  # Skip Naive itself
+    # Speedup = Naive time / algorithm time, for every (algorithm, size) at once
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speedups = baseline / time_matrix
+    sizes = np.array(SIZES)
+    
+    fig = get_figure((12, 7))
+    ax = fig.add_subplot()
+    
+    for algo_idx, algo_id in enumerate(algo_order):
+        if algo_id == 15:  # Skip Naive itself
             continue
         
-        speedups = []
-        sizes = []
-        
-        for i, size in enumerate(data["sizes"]):
-            if size in naive_sizes:
-                naive_idx = naive_sizes.index(size)
-                if naive_times[naive_idx] > 0 and data["times"][i] > 0:
-                    speedup = naive_times[naive_idx] / data["times"][i]
-                    speedups.append(speedup)
-                    sizes.append(size)
-        
-        if speedups:
+        mask = np.isfinite(speedups[algo_idx]) & (speedups[algo_idx] > 0)
+        if mask.any():
             algo_info = ALGORITHMS[algo_id]
-            plt.plot(sizes, speedups, marker='o', 
+            ax.plot(sizes[mask], speedups[algo_idx][mask], marker='o', 
                     label=algo_info['name'], 
                     color=algo_info['color'], linewidth=2, markersize=6)
-    
-    plt.axhline(y=1.0, color='red', linestyle='--', linewidth=2, label='Baseline (Naive)', alpha=0.7)
-    plt.xlabel("Text Size (base pairs)", fontsize=12, fontweight='bold')
-    plt.ylabel("Speedup Factor (relative to Naive)", fontsize=12, fontweight='bold')
-    plt.title("Algorithm Speedup Comparison\n(Speedup = Naive Time / Algorithm Time)", 
+            
+            ext_mask = mask & extrapolated
+            if ext_mask.any():
+                ax.plot(sizes[ext_mask], speedups[algo_idx][ext_mask], 'o', markersize=8, 
+                        markerfacecolor='white', markeredgecolor=algo_info['color'], 
+                        markeredgewidth=2)
+    
+    if extrapolated.any():
+        # Legend entry for the hollow markers
+        ax.plot([], [], 'o', markersize=8, markerfacecolor='white', markeredgecolor='gray', 
+                markeredgewidth=2, label='vs. extrapolated Naive')
+    
+    ax.axhline(y=1.0, color='red', linestyle='--', linewidth=2, label='Baseline (Naive)', alpha=0.7)
+    ax.set_xlabel("Text Size (base pairs)", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Speedup Factor (relative to Naive)", fontsize=12, fontweight='bold')
+    ax.set_title("Algorithm Speedup Comparison\n(Speedup = Naive Time / Algorithm Time)", 
               fontsize=14, fontweight='bold')
-    plt.legend(loc='best', fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.xscale('log')
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    ax.set_xscale('log')
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=300, bbox_inches='tight')
     print(f"Saved: {output_file}")
-    plt.close()
 
-def plot_complexity_verification(results, output_file):
-    """Verify theoretical complexity by plotting log-log graphs"""
-    fig = plt.figure(figsize=(16, 10))
-    gs = GridSpec(2, 3, figure=fig)
-    
-    plot_configs = [
-        (15, 0, 0, "Naive - O(nm)"),
-        (3, 0, 1, "KMP - O(n+m)"),
-        (4, 0, 2, "Boyer-Moore - O(n/m) best"),
-        (11, 1, 0, "Rabin-Karp - O(n+m)"),
-        (12, 1, 1, "Z-Algorithm - O(n+m)"),
-        (6, 1, 2, "Shift-Or - O(n)")
-    ]
-    
-    for algo_id, row, col, title in plot_configs:
-        ax = fig.add_subplot(gs[row, col])
-        data = results[algo_id]
+def draw_complexity_subplot(ax, algo_id, data, title):
+    """Draw one log-log panel of measured times and their power-law fit"""
+    if data["times"] and data["sizes"]:
+        sizes = np.array(data["sizes"])
+        times = np.array(data["times"])
+        measured = ~np.isin(sizes, data["extrapolated"])
         
-        if data["times"] and data["sizes"]:
-            sizes = np.array(data["sizes"])
-            times = np.array(data["times"])
-            
-            # Plot actual data
-            ax.loglog(sizes, times, 'o-', color=ALGORITHMS[algo_id]['color'], 
-                     linewidth=2, markersize=6, label='Actual')
-            
-            # Fit and plot theoretical curve
-            if len(sizes) > 1:
-                # Simple linear fit in log-log space
-                coeffs = np.polyfit(np.log(sizes), np.log(times), 1)
-                fitted = np.exp(coeffs[1]) * sizes ** coeffs[0]
-                ax.loglog(sizes, fitted, '--', color='red', 
-                         linewidth=2, alpha=0.7, label=f'Fit: O(n^{coeffs[0]:.2f})')
-            
-            ax.set_xlabel("Text Size (bp)", fontweight='bold')
-            ax.set_ylabel("Time (ms)", fontweight='bold')
-            ax.set_title(title, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-            ax.legend()
-    
-    plt.suptitle("Theoretical Complexity Verification", 
-                 fontsize=16, fontweight='bold', y=0.995)
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        # Plot actual data
+        ax.loglog(sizes, times, 'o-', color=ALGORITHMS[algo_id]['color'], 
+                 linewidth=2, markersize=6, label='Actual')
+        if not measured.all():
+            ax.loglog(sizes[~measured], times[~measured], 'o', markersize=8, 
+                     markerfacecolor='white', markeredgecolor=ALGORITHMS[algo_id]['color'], 
+                     markeredgewidth=2, label='Extrapolated')
+        
+        # Fit and plot theoretical curve on measured points only
+        if measured.sum() > 1:
+            # Simple linear fit in log-log space
+            coeffs = np.polyfit(np.log(sizes[measured]), np.log(times[measured]), 1)
+            fitted = np.exp(coeffs[1]) * sizes ** coeffs[0]
+            ax.loglog(sizes, fitted, '--', color='red', 
+                     linewidth=2, alpha=0.7, label=f'Fit: O(n^{coeffs[0]:.2f})')
+        
+        ax.set_xlabel("Text Size (bp)", fontweight='bold')
+        ax.set_ylabel("Time (ms)", fontweight='bold')
+        ax.set_title(title, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+
+def render_complexity_subplot(algo_id, data, title, figsize, dpi, xlim=None, ylim=None):
+    """Render one complexity panel on its own figure and return PNG bytes"""
+    fig = plt.figure(figsize=figsize)
+    ax = fig.add_subplot()
+    draw_complexity_subplot(ax, algo_id, data, title)
+    if xlim:
+        ax.set_xlim(xlim)
+    if ylim:
+        ax.set_ylim(ylim)
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi)
+    plt.close(fig)
+    return buf.getvalue()
+
+def plot_complexity_verification(results, output_file):
+    """Verify theoretical complexity by plotting log-log graphs
+
+    Each panel is rendered in a worker process and the PNGs are pasted into
+    one 2x3 image; with fewer than two points per series there is nothing
+    worth parallelizing and the panels are drawn on the shared figure instead.
+    Either way all panels use the same axis limits.
+    """
+    if all(len(results[algo_id]["sizes"]) < 2 for algo_id, _, _, _ in PLOT_CONFIGS):
+        fig = get_figure((16, 10))
+        axes = fig.subplots(2, 3, sharex=True, sharey=True)
+        for algo_id, row, col, title in PLOT_CONFIGS:
+            draw_complexity_subplot(axes[row, col], algo_id, results[algo_id], title)
+        fig.suptitle("Theoretical Complexity Verification", 
+                     fontsize=16, fontweight='bold', y=0.995)
+        fig.tight_layout()
+        fig.savefig(output_file, dpi=300, bbox_inches='tight')
+        print(f"Saved: {output_file}")
+        return
+    
+    # 16x10 in canvas at 300 dpi: a title strip above a 2x3 grid of panels
+    dpi = 300
+    width_in, title_in, panel_h_in = 16, 0.5, 4.75
+    panel_size = (width_in / 3, panel_h_in)
+    panel_px = (int(panel_size[0] * dpi), int(panel_size[1] * dpi))
+    title_px = int(title_in * dpi)
+    
+    # Panels live on separate figures, so share axes by giving them common limits
+    all_sizes = np.concatenate([results[algo_id]["sizes"] for algo_id, _, _, _ in PLOT_CONFIGS])
+    all_times = np.concatenate([results[algo_id]["times"] for algo_id, _, _, _ in PLOT_CONFIGS])
+    all_times = all_times[all_times > 0]
+    xlim = (all_sizes.min() / 1.5, all_sizes.max() * 1.5)
+    ylim = (all_times.min() / 1.5, all_times.max() * 1.5) if all_times.size else None
+    
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(PLOT_CONFIGS))) as executor:
+        futures = {executor.submit(render_complexity_subplot, algo_id, results[algo_id],
+                                   title, panel_size, dpi, xlim, ylim): (row, col)
+                   for algo_id, row, col, title in PLOT_CONFIGS}
+        panels = {futures[future]: future.result() for future in as_completed(futures)}
+    
+    fig = get_figure((width_in, title_in))
+    fig.text(0.5, 0.5, "Theoretical Complexity Verification", 
+             fontsize=16, fontweight='bold', ha='center', va='center')
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi)
+    
+    canvas = Image.new("RGB", (3 * panel_px[0], title_px + 2 * panel_px[1]), "white")
+    canvas.paste(Image.open(io.BytesIO(buf.getvalue())), (0, 0))
+    for (row, col), png in panels.items():
+        canvas.paste(Image.open(io.BytesIO(png)), (col * panel_px[0], title_px + row * panel_px[1]))
+    canvas.save(output_file, dpi=(dpi, dpi))
     print(f"Saved: {output_file}")
-    plt.close()
 
 def generate_latex_table(results, memory_data, output_file):
     """Generate LaTeX table for inclusion in the report"""
@@ -344,18 +580,25 @@ def generate_latex_table(results, memory_data, output_file):
         target_size = 100000
         baseline_time = None
         
-        # Get baseline (Naive) time
-        if 15 in results and target_size in results[15]["sizes"]:
-            idx = results[15]["sizes"].index(target_size)
-            baseline_time = results[15]["times"][idx]
+        # size -> time per algorithm, built once instead of list.index scans
+        time_maps = {algo_id: dict(zip(data["sizes"], data["times"]))
+                     for algo_id, data in results.items()}
+        
+        # Get baseline (Naive) time; extrapolated values are marked with *
+        baseline_extrapolated = False
+        if 15 in time_maps:
+            baseline_time = time_maps[15].get(target_size)
+            baseline_extrapolated = target_size in results[15]["extrapolated"]
         
         for algo_id in sorted(ALGORITHMS.keys()):
             algo_info = ALGORITHMS[algo_id]
             
+            current_time = time_maps[algo_id].get(target_size)
             time_val = "N/A"
-            if target_size in results[algo_id]["sizes"]:
-                idx = results[algo_id]["sizes"].index(target_size)
-                time_val = f"{results[algo_id]['times'][idx]:.3f}"
+            if current_time is not None:
+                time_val = f"{current_time:.3f}"
+                if target_size in results[algo_id]["extrapolated"]:
+                    time_val += "*"
             
             mem_val = "~0"
             if algo_id in memory_data:
@@ -363,16 +606,19 @@ def generate_latex_table(results, memory_data, output_file):
                 mem_val = f"{mem_kb:.1f}" if mem_kb > 0 else "~0"
             
             speedup_val = "1.00x"
-            if baseline_time and time_val != "N/A":
-                current_time = float(time_val)
+            if baseline_time and current_time is not None:
                 if current_time > 0:
                     speedup = baseline_time / current_time
                     speedup_val = f"{speedup:.2f}x"
+            if baseline_extrapolated:
+                speedup_val += "*"
             
             f.write(f"{algo_info['name']} & {time_val} & {mem_val} & {algo_info['complexity']} & {speedup_val} \\\\\n")
             f.write("\\hline\n")
         
         f.write("\\end{tabular}\n")
+        if baseline_extrapolated:
+            f.write("\\par\\smallskip{\\footnotesize * Based on an extrapolated Naive time (log-log fit of measured sizes)}\n")
         f.write("\\end{table}\n")
     
     print(f"Saved: {output_file}")
@@ -380,44 +626,34 @@ def generate_latex_table(results, memory_data, output_file):
 def generate_detailed_csv(results_text_size, results_pattern_len, output_file):
     """Generate detailed CSV file with all benchmark data"""
     
-    data_rows = []
-    
-    # Text size variation data
-    for algo_id, data in results_text_size.items():
-        algo_name = ALGORITHMS[algo_id]['name']
-        for i, size in enumerate(data["sizes"]):
-            data_rows.append({
-                'Algorithm': algo_name,
-                'Benchmark': 'Varying Text Size',
-                'Text_Size': size,
-                'Pattern_Length': 10,
-                'Time_ms': data["times"][i]
-            })
-    
-    # Pattern length variation data
-    for algo_id, data in results_pattern_len.items():
-        algo_name = ALGORITHMS[algo_id]['name']
-        for i, plen in enumerate(data["pattern_lens"]):
-            data_rows.append({
-                'Algorithm': algo_name,
-                'Benchmark': 'Varying Pattern Length',
-                'Text_Size': 100000,
-                'Pattern_Length': plen,
-                'Time_ms': data["times"][i]
-            })
-    
-    df = pd.DataFrame(data_rows)
-    df.to_csv(output_file, index=False)
+    with open(output_file, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['Algorithm', 'Benchmark', 'Text_Size', 'Pattern_Length', 'Time_ms', 'Extrapolated'])
+        
+        # Text size variation data
+        for algo_id, data in results_text_size.items():
+            algo_name = ALGORITHMS[algo_id]['name']
+            writer.writerows((algo_name, 'Varying Text Size', size, 10, time_ms,
+                              size in data["extrapolated"])
+                             for size, time_ms in zip(data["sizes"], data["times"]))
+        
+        # Pattern length variation data
+        for algo_id, data in results_pattern_len.items():
+            algo_name = ALGORITHMS[algo_id]['name']
+            writer.writerows((algo_name, 'Varying Pattern Length', 100000, plen, time_ms, False)
+                             for plen, time_ms in zip(data["pattern_lens"], data["times"]))
+    
     print(f"Saved: {output_file}")
 
 def cleanup():
     """Clean up temporary files"""
-    if os.path.exists(TEMP_DIR):
-        for f in os.listdir(TEMP_DIR):
-            os.remove(os.path.join(TEMP_DIR, f))
-        os.rmdir(TEMP_DIR)
+    _seq_cache.clear()
+    shutil.rmtree(TEMP_DIR, ignore_errors=True)
 
 def main():
+    global RNG
+    RNG = np.random.default_rng(SEED)
+    
     print("\n" + "="*60)
     print(" COMPREHENSIVE DNA PATTERN MATCHING BENCHMARK SUITE")
     print("="*60)
@@ -429,7 +665,7 @@ def main():
     subprocess.run(["make"], cwd=PROJECT_ROOT, check=True)
     
     # Run benchmarks
-    results_text_size = benchmark_varying_text_size(pattern_len=10)
+    results_text_size, time_matrix = benchmark_varying_text_size(pattern_len=10)
     results_pattern_len = benchmark_varying_pattern_length(text_size=100000)
     memory_data = benchmark_memory_usage()
     
@@ -447,7 +683,7 @@ def main():
     plot_memory_usage(memory_data, 
                      f"{OUTPUT_DIR}/memory_usage.png")
     
-    plot_speedup_comparison(results_text_size, 
+    plot_speedup_comparison(results_text_size, time_matrix, 
                            f"{OUTPUT_DIR}/speedup_comparison.png")
     
     plot_complexity_verification(results_text_size, 
@@ -462,6 +698,7 @@ def main():
                          f"{OUTPUT_DIR}/benchmark_data.csv")
     
     # Cleanup
+    stop_server()
     cleanup()
     
     print(f"\n{'='*60}")
@@ -316,49 +316,111 @@ void run_comprehensive_tests() {
     free_approximate_match_result(&lev_result);
 }
 
-// Helper to run benchmark mode
-void run_benchmark_mode(int algo_id, const char *filename, const char *pattern) {
+// Run one algorithm on a FASTA file `iterations` times, returning the mean
+// time in ms (-1 on error). The file is loaded, and the suffix tree built, once.
+double benchmark_algorithm(int algo_id, const char *filename, const char *pattern, int iterations) {
     DNASequence *seq = load_fasta_file(filename);
     if (!seq) {
         fprintf(stderr, "Error loading file\n");
-        return;
+        return -1.0;
     }
+    if (iterations < 1) iterations = 1;
 
-    MatchResult result;
-    // Initialize result to avoid compiler warnings
-    result.time_taken = -1.0;
-    result.positions = NULL;
-    result.count = 0;
+    SuffixTree *st = NULL;
+    if (algo_id == 5) {
+        // Suffix tree: O(n²) construction (untimed) + O(m) search
+        st = create_suffix_tree(seq->sequence);
+    }
+
+    // One monotonic timer around all iterations, so per-call clock()
+    // granularity and start/stop overhead are amortized over N searches
+    int failed = 0;
+    struct timespec start, end;
+    clock_gettime(CLOCK_MONOTONIC, &start);
+    for (int i = 0; i < iterations; i++) {
+        MatchResult result;
+        // Initialize result to avoid compiler warnings
+        result.time_taken = -1.0;
+        result.positions = NULL;
+        result.count = 0;
 
-    switch(algo_id) {
-        case 3: result = kmp_search(seq->sequence, pattern); break;
-        case 15: result = naive_search(seq->sequence, pattern); break;
-        case 4: result = boyer_moore_search(seq->sequence, pattern); break;
-        case 5: {
-             // Suffix tree: O(n²) construction + O(m) search
-             SuffixTree *st = create_suffix_tree(seq->sequence);
-             result = suffix_tree_search(st, pattern);
-             free_suffix_tree(st);
-             break;
+        switch(algo_id) {
+            case 3: result = kmp_search(seq->sequence, pattern); break;
+            case 15: result = naive_search(seq->sequence, pattern); break;
+            case 4: result = boyer_moore_search(seq->sequence, pattern); break;
+            case 5: result = suffix_tree_search(st, pattern); break;
+            case 6: result = shift_or_search(seq->sequence, pattern); break;
+            case 11: result = rabin_karp_search(seq->sequence, pattern); break;
+            case 12: result = z_algorithm_search(seq->sequence, pattern); break;
+            default: fprintf(stderr, "Unknown algorithm\n"); break;
         }
-        case 6: result = shift_or_search(seq->sequence, pattern); break;
-        case 11: result = rabin_karp_search(seq->sequence, pattern); break;
-        case 12: result = z_algorithm_search(seq->sequence, pattern); break;
-        default: fprintf(stderr, "Unknown algorithm\n"); break;
-    }
 
-    if (result.time_taken >= 0) {
-        printf("%f\n", result.time_taken);
+        if (result.time_taken < 0) {
+            failed = 1;
+            break;
+        }
         free_match_result(&result);
     }
+    clock_gettime(CLOCK_MONOTONIC, &end);
+
+    if (st) free_suffix_tree(st);
     free_dna_sequence(seq);
+    if (failed) return -1.0;
+
+    double elapsed_ms = (end.tv_sec - start.tv_sec) * 1000.0 +
+                        (end.tv_nsec - start.tv_nsec) / 1e6;
+    return elapsed_ms / iterations;
+}
+
+// Helper to run benchmark mode
+void run_benchmark_mode(int algo_id, const char *filename, const char *pattern, int iterations) {
+    double time_taken = benchmark_algorithm(algo_id, filename, pattern, iterations);
+    if (time_taken >= 0) {
+        printf("%f\n", time_taken);
+    }
+}
+
+/*
+ * Benchmark server mode: a long-lived coprocess for the bench scripts.
+ * Reads one request per line on stdin:   <algo_id>\t<text_file>\t<pattern>[\t<iterations>]\n
+ * Writes exactly one line per request:   <mean_time_ms>\n   (-1.000000 on error)
+ * Exits on EOF.
+ */
+void run_benchmark_server(void) {
+    char line[8192];
+
+    while (fgets(line, sizeof(line), stdin)) {
+        line[strcspn(line, "\r\n")] = '\0';
+
+        char *algo = strtok(line, "\t");
+        char *filename = strtok(NULL, "\t");
+        char *pattern = strtok(NULL, "\t");
+        char *iterations = strtok(NULL, "\t");
+
+        double time_taken = -1.0;
+        if (algo && filename && pattern) {
+            time_taken = benchmark_algorithm(atoi(algo), filename, pattern,
+                                             iterations ? atoi(iterations) : 1);
+        } else {
+            fprintf(stderr, "Malformed benchmark request\n");
+        }
+
+        printf("%f\n", time_taken < 0 ? -1.0 : time_taken);
+        fflush(stdout);
+    }
 }
 
 int main(int argc, char *argv[]) {
     // Check for benchmark mode
-    if (argc == 5 && strcmp(argv[1], "--benchmark") == 0) {
+    // --benchmark <algo_id> <text_file> <pattern> [iterations]
+    if ((argc == 5 || argc == 6) && strcmp(argv[1], "--benchmark") == 0) {
         int algo_id = atoi(argv[2]);
-        run_benchmark_mode(algo_id, argv[3], argv[4]);
+        int iterations = argc == 6 ? atoi(argv[5]) : 1;
+        run_benchmark_mode(algo_id, argv[3], argv[4], iterations);
+        return 0;
+    }
+    if (argc == 2 && strcmp(argv[1], "--benchmark-server") == 0) {
+        run_benchmark_server();
         return 0;
     }
 